@@ -1,17 +1,27 @@
 import sys
 import os
+import functools
+import io
+import shutil
+import subprocess
+import tempfile
 import threading
 import time
 import zipfile
+import concurrent.futures
 from datetime import datetime
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QPushButton, QFileDialog, QProgressBar, QListWidget, 
-    QListWidgetItem, QMenu, QAction, QDialog, QGridLayout, QScrollArea,
+    QListWidgetItem, QListView, QMenu, QAction, QDialog, QGridLayout, QScrollArea,
     QMessageBox, QStyle, QSystemTrayIcon
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize, QUrl
-from PyQt5.QtGui import QIcon, QPixmap, QFont, QColor, QCursor
+from PyQt5.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, QSize, QUrl
+)
+from PyQt5.QtGui import (
+    QIcon, QPixmap, QPixmapCache, QImageReader, QFont, QColor, QCursor
+)
 
 # 尝试导入Pillow库，如果失败则提示用户安装
 try:
@@ -20,71 +30,305 @@ except ImportError:
     QMessageBox.critical(None, "错误", "缺少Pillow库，请运行 'pip install pillow' 安装")
     sys.exit(1)
 
-class ImageCompressThread(QThread):
-    """图片压缩线程"""
+# 可选的无损优化后端：缺失时回退到Pillow重编码
+try:
+    import mozjpeg_lossless_optimization
+except ImportError:
+    mozjpeg_lossless_optimization = None
+
+try:
+    import oxipng
+except ImportError:
+    oxipng = None
+
+# 可选的外部无损压缩工具，按需通过PATH解析
+_JPEGTRAN = shutil.which('jpegtran')
+_OXIPNG = shutil.which('oxipng')
+_CWEBP = shutil.which('cwebp')
+
+def _lossless_recompress(data, image_format, src_path=None):
+    """在已编码字节流上做无损重压缩，无可用后端时返回None
+
+    JPEG只重建Huffman表（mozjpeg/jpegtran），PNG只重压deflate流
+    （oxipng库或命令行），WEBP交给cwebp做无损重编码；外部工具
+    出错时同样返回None，由调用方回退到Pillow。
+    """
+    try:
+        if image_format == 'JPEG':
+            if mozjpeg_lossless_optimization is not None:
+                return mozjpeg_lossless_optimization.optimize(data)
+            if _JPEGTRAN:
+                proc = subprocess.run(
+                    [_JPEGTRAN, '-optimize', '-copy', 'none'],
+                    input=data, stdout=subprocess.PIPE, check=True
+                )
+                return proc.stdout
+        elif image_format == 'PNG':
+            if oxipng is not None:
+                return oxipng.optimize_from_memory(data, level=2)
+            if _OXIPNG:
+                proc = subprocess.run(
+                    [_OXIPNG, '--opt', '2', '--strip', 'safe', '--stdout', '-'],
+                    input=data, stdout=subprocess.PIPE, check=True
+                )
+                return proc.stdout
+        elif image_format == 'WEBP' and _CWEBP and src_path:
+            # cwebp只接受文件参数，输出经临时文件中转
+            fd, tmp_out = tempfile.mkstemp(suffix='.webp')
+            os.close(fd)
+            try:
+                subprocess.run(
+                    [_CWEBP, '-quiet', '-lossless', '-z', '6',
+                     src_path, '-o', tmp_out],
+                    check=True
+                )
+                with open(tmp_out, 'rb') as f:
+                    return f.read()
+            finally:
+                os.unlink(tmp_out)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return None
+
+def _compress_one(image_path, original_size=None, image_format=None,
+                  progress=None, cancelled=None):
+    """压缩单张图片并返回结果字典，任务被取消时返回None。
+
+    模块级纯函数，可被子进程pickle调用；progress/cancelled为可选
+    回调，仅在线程内调用时传入。列表组件已经stat过文件、嗅探过
+    格式，通过参数传入可避免重复的系统调用。
+    """
+    # 获取原始文件大小（调用方未提供时才stat）
+    if original_size is None:
+        original_size = os.path.getsize(image_path)
+
+    # 无损快路径：直接重压缩已编码的字节流，不解码像素
+    optimized = None
+    image = None
+    if image_format in ('JPEG', 'PNG', 'WEBP'):
+        with open(image_path, 'rb') as f:
+            raw = f.read()
+        optimized = _lossless_recompress(raw, image_format, src_path=image_path)
+
+    if optimized is None:
+        # 回退：Pillow解码后重编码
+        image = Image.open(image_path)
+        if image_format is None:
+            image_format = image.format
+
+    # 输入读取完成，进度25%
+    if progress:
+        progress(25)
+
+    # 生成压缩后的文件名
+    base_name = os.path.basename(image_path)
+    name, ext = os.path.splitext(base_name)
+    output_path = os.path.join(
+        os.path.dirname(image_path),
+        f"{name}_compressed{ext}"
+    )
+
+    # 写盘前的取消检查点：取消的任务不留下半成品文件
+    if cancelled and cancelled():
+        return None
+
+    # 开始保存，进度50%
+    if progress:
+        progress(50)
+
+    # 先在内存中完成编码，拿到结果大小后再决定是否落盘
+    if optimized is not None:
+        data = optimized
+    else:
+        buf = io.BytesIO()
+        if image_format == 'JPEG':
+            # 两遍Huffman优化只对大文件划算，小文件直接单遍编码
+            if original_size > 2 * 1024 * 1024:
+                image.save(buf, format='JPEG', optimize=True,
+                           progressive=True, quality=85)
+            else:
+                image.save(buf, format='JPEG', quality=85)
+        elif image_format == 'PNG':
+            # zlib level 6比level 9快数倍，体积只差约2%
+            image.save(buf, format='PNG', compress_level=6)
+        elif image_format == 'WEBP':
+            image.save(buf, format='WEBP', optimize=True, quality=85)
+        else:
+            image.save(buf, format=image_format, optimize=True)
+        data = buf.getvalue()
+
+    if len(data) >= original_size:
+        # 重编码反而更大：保留原始字节，压缩比记为0
+        _fast_copy(image_path, output_path)
+        compressed_size = original_size
+    else:
+        with open(output_path, 'wb') as f:
+            f.write(data)
+        compressed_size = len(data)
+
+    # 计算压缩比例
+    compression_ratio = max(0, round((1 - compressed_size / original_size) * 100, 2))
+
+    return {
+        'original_path': image_path,  # 添加原始路径
+        'original_size': original_size,
+        'compressed_size': compressed_size,
+        'compression_ratio': compression_ratio,
+        'output_path': output_path,
+        'format': image_format
+    }
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+@functools.lru_cache(maxsize=4096)
+def _format_size(size):
+    """格式化文件大小：按bit长度直接定位单位，结果带LRU缓存"""
+    i = min(max(0, (int(size).bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (i * 10)):.2f} {_SIZE_UNITS[i]}"
+
+def _prefetch(path):
+    """提示内核预读文件内容
+
+    Linux上用posix_fadvise(WILLNEED)异步触发readahead；其他平台
+    读1字节也能让内核启动顺序预读。轮到该文件压缩时数据大概率
+    已在页缓存，避免冷缓存的打开停顿。
+    """
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        else:
+            with open(path, 'rb') as f:
+                f.read(1)
+    except OSError:
+        pass
+
+def _fast_copy(src, dst):
+    """快速复制文件
+
+    优先用os.sendfile在内核态搬运数据（16MB一批），避免用户态
+    read/write小缓冲循环；不支持的平台回退到shutil.copyfile，
+    最后单独同步元数据。
+    """
+    copied = False
+    if hasattr(os, 'sendfile'):
+        try:
+            size = os.path.getsize(src)
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(),
+                                       offset, 16 * 1024 * 1024)
+                    if sent == 0:
+                        break
+                    offset += sent
+            copied = offset >= size
+        except OSError:
+            copied = False
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+# 应用级样式表：列表项组件按objectName取样式，Qt对整段QSS只解析一次，
+# 不再为每个列表项实例重复解析内联样式
+GLOBAL_QSS = """
+QLabel#thumbnailLabel {
+    border: 1px solid #ddd;
+    border-radius: 3px;
+}
+QLabel#statusLabel {
+    color: #666;
+}
+QLabel#compressedSizeLabel {
+    color: #4CAF50;
+}
+QProgressBar#compressBar {
+    border: 1px solid #ddd;
+    border-radius: 5px;
+    text-align: center;
+    background: #f0f0f0;
+    height: 20px;
+}
+QProgressBar#compressBar::chunk {
+    background-color: #4CAF50;
+    border-radius: 5px;
+}
+QPushButton#downloadBtn {
+    background-color: white;
+    color: #4caf50;
+    border: 1px solid #f0f0f0;
+    padding: 0px 5px;
+    border-radius: 4px;
+    font-size: 12px;
+    font-weight: bold;
+    min-height: 30px;
+}
+QPushButton#downloadBtn:hover {
+    background-color: #f0f0f0;
+}
+"""
+
+class WorkerSignals(QObject):
+    """压缩任务信号（QRunnable不能自带信号，需挂在QObject上）"""
     progress_update = pyqtSignal(str, int)
     compress_finished = pyqtSignal(str, dict)
 
-    def __init__(self, image_path):
+class ImageCompressWorker(QRunnable):
+    """图片压缩任务，在全局线程池中执行"""
+
+    def __init__(self, image_path, original_size=None, image_format=None):
         super().__init__()
         self.image_path = image_path
+        self.original_size = original_size
+        self.image_format = image_format
+        self.signals = WorkerSignals()
+        self._cancel = threading.Event()
+        self._last_emitted = -10  # 上次发出的进度，在源头限流
+
+    def cancel(self):
+        """请求取消任务（协作式，下一个检查点生效）"""
+        self._cancel.set()
 
     def run(self):
         """执行压缩"""
         try:
-            # 获取原始文件大小
-            original_size = os.path.getsize(self.image_path)
-            
-            # 打开图片
-            image = Image.open(self.image_path)
-            image_format = image.format
-            
-            # 生成压缩后的文件名
-            base_name = os.path.basename(self.image_path)
-            name, ext = os.path.splitext(base_name)
-            output_path = os.path.join(
-                os.path.dirname(self.image_path),
-                f"{name}_compressed{ext}"
+            if self._cancel.is_set():
+                return
+
+            result = _compress_one(
+                self.image_path,
+                original_size=self.original_size,
+                image_format=self.image_format,
+                progress=self._report_progress,
+                cancelled=self._cancel.is_set
             )
-            
-            # 模拟压缩进度
-            for i in range(101):
-                time.sleep(0.01)  # 减少模拟处理时间，提高响应速度
-                # 发送进度更新信号
-                self.progress_update.emit(self.image_path, i)
-            
-            # 保存压缩后的图片（使用优化参数）
-            if image_format == 'JPEG':
-                image.save(output_path, optimize=True, quality=85)
-            elif image_format == 'PNG':
-                image.save(output_path, optimize=True, compress_level=9)
-            elif image_format == 'WEBP':
-                image.save(output_path, optimize=True, quality=85)
-            else:
-                image.save(output_path, optimize=True)
-            
-            # 获取压缩后的文件大小
-            compressed_size = os.path.getsize(output_path)
-            
-            # 计算压缩比例
-            compression_ratio = round((1 - compressed_size / original_size) * 100, 2)
-            
-            # 发送完成信号
-            result = {
-                'original_path': self.image_path,  # 添加原始路径
-                'original_size': original_size,
-                'compressed_size': compressed_size,
-                'compression_ratio': compression_ratio,
-                'output_path': output_path,
-                'format': image_format
-            }
+            if result is None:
+                # 任务在检查点被取消，不发完成信号
+                return
+
             # 确保发送100%进度
-            self.progress_update.emit(self.image_path, 100)
-            self.compress_finished.emit(self.image_path, result)
-            
+            self.signals.progress_update.emit(self.image_path, 100)
+            self.signals.compress_finished.emit(self.image_path, result)
+
         except Exception as e:
             print(f"压缩失败: {e}")
-            self.compress_finished.emit(self.image_path, None)
+            self.signals.compress_finished.emit(self.image_path, None)
+
+    def _report_progress(self, pct):
+        """进度回调：取消后不再发送，且进度增量不足10%时在源头丢弃
+
+        限流放在工作线程侧，跨线程事件在产生前就被合并，
+        主线程无需为每个百分点付出一次排队与GIL切换。
+        """
+        if self._cancel.is_set():
+            return
+        if pct - self._last_emitted < 10 and pct != 100:
+            return
+        self._last_emitted = pct
+        self.signals.progress_update.emit(self.image_path, pct)
 
 class ImageItemWidget(QWidget):
     """图片项组件"""
@@ -95,10 +339,11 @@ class ImageItemWidget(QWidget):
         self.original_size = os.path.getsize(image_path)
         self.compress_ratio = 0
         self.status = "等待中"
-        self.format = "未知"
+        self.format = self._sniff_format(image_path)
         self.compressed_size = 0
         self.start_time = None
         self.remaining_time = "估算中..."
+        self._last_drawn = -5  # 上次绘制的进度，用于合并过密的刷新
         
         # 布局
         layout = QHBoxLayout()  # 改为水平布局
@@ -107,13 +352,12 @@ class ImageItemWidget(QWidget):
         # 缩略图
         self.thumbnail_label = QLabel()
         self.thumbnail_label.setFixedSize(60, 60)
-        self.thumbnail_label.setStyleSheet("border: 1px solid #ddd; border-radius: 3px;")
+        self.thumbnail_label.setObjectName("thumbnailLabel")
         # 加载并显示缩略图
         try:
-            pixmap = QPixmap(self.image_path)
-            # 调整图片大小为缩略图
-            pixmap = pixmap.scaled(60, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.thumbnail_label.setPixmap(pixmap)
+            pixmap = self._load_thumbnail(self.image_path)
+            if pixmap is not None and not pixmap.isNull():
+                self.thumbnail_label.setPixmap(pixmap)
         except Exception as e:
             print(f"加载缩略图失败: {e}")
         
@@ -128,7 +372,7 @@ class ImageItemWidget(QWidget):
         self.name_label.setMinimumHeight(20)  # 增加标签高度，确保文字完整显示
         self.status_label = QLabel(self.status)
         self.status_label.setFont(QFont("Arial", 9))
-        self.status_label.setStyleSheet("color: #666;")
+        self.status_label.setObjectName("statusLabel")
         header_layout.addWidget(self.name_label)
         header_layout.addStretch()
         header_layout.addWidget(self.status_label)
@@ -138,7 +382,8 @@ class ImageItemWidget(QWidget):
         info_layout.setSpacing(25)  # 增加间距，使大小和剩余时间之间有合适的间距
         self.format_label = QLabel(f"格式: {self.format}")
         self.format_label.setFont(QFont("Arial", 9))
-        self.size_label = QLabel(f"大小: {self._format_size(self.original_size)}")
+        self._orig_size_str = _format_size(self.original_size)
+        self.size_label = QLabel(f"大小: {self._orig_size_str}")
         self.size_label.setFont(QFont("Arial", 9))
         self.time_label = QLabel(f"剩余时间: {self.remaining_time}")
         self.time_label.setFont(QFont("Arial", 9))
@@ -153,19 +398,7 @@ class ImageItemWidget(QWidget):
         self.progress_bar.setValue(0)
         self.progress_bar.setFormat("0%")  # 初始显示0%
         self.progress_bar.setTextVisible(True)  # 确保文本可见
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                text-align: center;
-                background: #f0f0f0;
-                height: 20px;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 5px;
-            }
-        """)
+        self.progress_bar.setObjectName("compressBar")
         
         # 压缩结果
         result_layout = QHBoxLayout()
@@ -174,10 +407,10 @@ class ImageItemWidget(QWidget):
         # 压缩大小标签
         self.size_label_compressed = QLabel("")
         self.size_label_compressed.setFont(QFont("Arial", 10, QFont.Bold))
-        self.size_label_compressed.setStyleSheet("color: #4CAF50;")
+        self.size_label_compressed.setObjectName("compressedSizeLabel")
         # 下载按钮（文字）
         self.download_button = QPushButton("下载")
-        self.download_button.setStyleSheet("QPushButton { background-color: white; color: #4caf50; border: 1px solid #f0f0f0; padding: 0px 5px; border-radius: 4px; font-size: 12px; font-weight: bold; min-height: 30px; } QPushButton:hover { background-color: #f0f0f0; }")
+        self.download_button.setObjectName("downloadBtn")
         self.download_button.setVisible(False)
         # 添加按钮提示
         self.download_button.setToolTip("下载图片")
@@ -200,28 +433,69 @@ class ImageItemWidget(QWidget):
         
         self.setLayout(layout)
     
-    def _format_size(self, size):
-        """格式化文件大小"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024.0:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} TB"
-    
+    @staticmethod
+    def _sniff_format(path):
+        """通过文件头魔数识别格式，免去一次完整的Image.open"""
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(16)
+        except OSError:
+            return "未知"
+        if header.startswith(b'\xff\xd8'):
+            return 'JPEG'
+        if header.startswith(b'\x89PNG\r\n\x1a\n'):
+            return 'PNG'
+        if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+            return 'WEBP'
+        return "未知"
+
+    @staticmethod
+    def _load_thumbnail(path):
+        """加载缩略图：按目标尺寸解码并用QPixmapCache缓存
+
+        QImageReader在解码阶段就缩放到60x60（JPEG走DCT降采样），
+        避免为缩略图解出全分辨率像素；缓存键包含mtime，文件变化时失效。
+        """
+        key = f"{path}:{os.path.getmtime(path)}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            reader = QImageReader(path)
+            size = reader.size()
+            if size.isValid():
+                reader.setScaledSize(size.scaled(60, 60, Qt.KeepAspectRatio))
+            pixmap = QPixmap.fromImage(reader.read())
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
     def update_progress(self, value):
         """更新进度"""
+        # 合并刷新：进度变化不足5%且未完成时跳过重绘，减少跨线程事件开销
+        if value - self._last_drawn < 5 and value != 100:
+            return
+        self._last_drawn = value
+
         self.progress_bar.setValue(value)
         # 显示进度百分比
         self.progress_bar.setFormat(f"{value}%")
         self.progress_bar.setTextVisible(True)  # 确保文本可见
-        
-        # 估算剩余时间
-        if value > 0 and self.start_time:
-            elapsed_time = time.time() - self.start_time
-            total_time = elapsed_time / (value / 100)
-            remaining = total_time - elapsed_time
-            if remaining > 0:
-                self.remaining_time = f"{remaining:.1f}s"
+
+    def _recompute_eta(self):
+        """按当前进度重新估算剩余时间
+
+        由主窗口的定时器按固定节拍统一调用，不再在每个进度信号里
+        重复计算。
+        """
+        value = self._last_drawn
+        if value <= 0 or not self.start_time:
+            return
+        elapsed_time = time.time() - self.start_time
+        total_time = elapsed_time / (value / 100)
+        remaining = total_time - elapsed_time
+        if remaining > 0:
+            remaining_str = f"{remaining:.1f}s"
+            # 文本未变化时不重设标签，避免无谓重绘
+            if remaining_str != self.remaining_time:
+                self.remaining_time = remaining_str
                 self.time_label.setText(f"剩余时间: {self.remaining_time}")
     
     def update_status(self, status):
@@ -241,10 +515,10 @@ class ImageItemWidget(QWidget):
             self.format = result['format']
             
             self.format_label.setText(f"格式: {self.format}")
-            self.size_label.setText(f"大小: {self._format_size(self.original_size)}")
+            self.size_label.setText(f"大小: {self._orig_size_str}")
             self.time_label.setText(f"剩余时间: 0s")
             self.ratio_label.setText(f"压缩比例: {self.compress_ratio}%")
-            self.size_label_compressed.setText(f" 压缩后: {self._format_size(self.compressed_size)}")
+            self.size_label_compressed.setText(f" 压缩后: {_format_size(self.compressed_size)}")
             self.status_label.setText("已完成")
             # 确保进度条显示100%
             self.progress_bar.setValue(100)
@@ -258,12 +532,18 @@ class ImageItemWidget(QWidget):
 
 class MainWindow(QMainWindow):
     """主窗口"""
+    # 进程池完成回调在子线程触发，通过信号转回主线程
+    proc_compress_finished = pyqtSignal(str, dict)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("图片无损压缩客户端")
         self.setGeometry(100, 100, 800, 600)
         self.setWindowIcon(QIcon(QApplication.style().standardIcon(QStyle.SP_DialogYesButton)))
         
+        # 列表项组件的样式集中在应用级样式表里，只解析一次
+        QApplication.instance().setStyleSheet(GLOBAL_QSS)
+        
         # 中央组件
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -356,6 +636,11 @@ class MainWindow(QMainWindow):
             }
         """)
         
+        # 大批量添加时统一行高并按批布局，避免每个item触发一次全量layout
+        self.image_list.setUniformItemSizes(True)
+        self.image_list.setLayoutMode(QListView.Batched)
+        self.image_list.setBatchSize(32)
+
         # 底部状态栏
         self.statusBar().showMessage("就绪")
         
@@ -366,15 +651,33 @@ class MainWindow(QMainWindow):
         # 菜单项
         self.create_menu()
         
-        # 数据
-        self.image_items = {}  # 存储图片路径和对应的组件
-        self.compress_threads = {}  # 存储压缩线程
-        self.completed_images = []  # 存储已完成的图片
+        # 线程池：按CPU核数限制并发，避免每图一线程的开销
+        self.pool = QThreadPool.globalInstance()
+        self.pool.setMaxThreadCount(os.cpu_count() or 4)
+
+        # 进程池：PNG重编码是纯CPU工作且Pillow不释放GIL，放到子进程并行
+        self.proc_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=os.cpu_count() or 4
+        )
+        self.proc_compress_finished.connect(self.handle_compress_finished)
+
+        # 数据：按整数id索引的平行数组（列表行号即id），外加路径到id的映射
+        self.paths = []          # id -> 图片路径
+        self.widgets = []        # id -> 列表项组件
+        self.results = []        # id -> 压缩结果dict，未完成为None
+        self.tasks = []          # id -> 压缩任务（线程池worker或进程池future）
+        self.path_to_id = {}     # 路径 -> id，O(1)反查
+        self._pending_cleanup = []  # 取消后待删除的半成品输出文件
         
         # 状态计数
         self.pending_count = 0
         self.processing_count = 0
         self.completed_count = 0
+
+        # 单个定时器以4Hz统一刷新所有进行中任务的剩余时间估算
+        self.eta_timer = QTimer(self)
+        self.eta_timer.timeout.connect(self._tick_etas)
+        self.eta_timer.start(250)
     
     def create_menu(self):
         """创建菜单栏"""
@@ -421,52 +724,95 @@ class MainWindow(QMainWindow):
         )
         
         if file_paths:
-            for file_path in file_paths:
-                if file_path not in self.image_items:
-                    # 创建图片项组件
-                    item = QListWidgetItem()
-                    widget = ImageItemWidget(file_path)
+            # 批量添加期间暂停列表重绘与信号，结束后一次性刷新布局
+            self.image_list.setUpdatesEnabled(False)
+            self.image_list.blockSignals(True)
+            added = 0
+            try:
+                for file_path in file_paths:
+                    if file_path not in self.path_to_id:
+                        # 创建图片项组件
+                        item = QListWidgetItem()
+                        widget = ImageItemWidget(file_path)
                     
-                    # 设置项大小
-                    item.setSizeHint(widget.sizeHint())
+                        # 设置项大小
+                        item.setSizeHint(widget.sizeHint())
                     
-                    # 添加到列表
-                    self.image_list.addItem(item)
-                    self.image_list.setItemWidget(item, widget)
+                        # 添加到列表（行号即图片id）
+                        self.image_list.addItem(item)
+                        self.image_list.setItemWidget(item, widget)
                     
-                    # 存储
-                    self.image_items[file_path] = (item, widget)
+                        # 存储
+                        self.path_to_id[file_path] = len(self.paths)
+                        self.paths.append(file_path)
+                        self.widgets.append(widget)
+                        self.results.append(None)
+                        self.tasks.append(None)
                     
-                    # 连接下载按钮
-                    widget.download_button.clicked.connect(
-                        lambda _, path=file_path: self.download_image(path)
-                    )
-                    
-                    # 更新计数
-                    self.pending_count += 1
-                    self.update_task_status()
+                        # 连接下载按钮
+                        widget.download_button.clicked.connect(
+                            lambda _, path=file_path: self.download_image(path)
+                        )
+                        
+                        added += 1
+            finally:
+                self.image_list.blockSignals(False)
+                self.image_list.setUpdatesEnabled(True)
+                self.image_list.update()
+            
+            # 更新计数（整批只刷新一次状态栏）
+            self.pending_count += added
+            self.update_task_status()
             
             # 开始压缩
             self.start_compression()
     
     def start_compression(self):
         """开始压缩所有待处理图片"""
-        for image_path, (_, widget) in self.image_items.items():
+        # 在独立IO线程里按派发顺序预读待处理文件，
+        # 当前文件编码时后续文件已被内核读进页缓存
+        pending_paths = [
+            self.paths[i] for i, w in enumerate(self.widgets)
+            if w.status == "等待中"
+        ]
+        if pending_paths:
+            threading.Thread(
+                target=lambda paths=tuple(pending_paths): [_prefetch(p) for p in paths],
+                daemon=True
+            ).start()
+
+        for image_id, image_path in enumerate(self.paths):
+            widget = self.widgets[image_id]
             if widget.status == "等待中":
-                # 创建并启动压缩线程
-                thread = ImageCompressThread(image_path)
-                thread.progress_update.connect(
-                    lambda value, path=image_path: self.update_compress_progress(path, value)
-                )
-                # 捕获 image_path 并确保参数顺序正确
-                def on_compress_finished(path, result, img_path=image_path):
-                    self.handle_compress_finished(img_path, result)
-                
-                thread.compress_finished.connect(on_compress_finished)
-                thread.start()
-                
-                # 存储线程
-                self.compress_threads[image_path] = thread
+                image_format = widget.format if widget.format != "未知" else None
+                if image_format == 'PNG':
+                    # PNG编码是CPU密集型且受GIL限制，交给进程池
+                    future = self.proc_pool.submit(
+                        _compress_one, image_path,
+                        original_size=widget.original_size,
+                        image_format=image_format
+                    )
+                    future.add_done_callback(
+                        functools.partial(self._on_proc_done, image_path)
+                    )
+                    self.tasks[image_id] = future
+                else:
+                    # JPEG/WEBP编码时libjpeg会释放GIL，线程池即可并行
+                    worker = ImageCompressWorker(
+                        image_path, widget.original_size, image_format
+                    )
+                    # 信号本身携带路径参数，直接连接槽函数即可，
+                    # 不再为每张图片构造闭包对象
+                    worker.signals.progress_update.connect(
+                        self.update_compress_progress, Qt.QueuedConnection
+                    )
+                    worker.signals.compress_finished.connect(
+                        self.handle_compress_finished, Qt.QueuedConnection
+                    )
+                    self.pool.start(worker)
+
+                    # 存储任务
+                    self.tasks[image_id] = worker
                 
                 # 更新状态
                 widget.update_status("压缩中...")
@@ -474,20 +820,42 @@ class MainWindow(QMainWindow):
                 self.pending_count -= 1
                 self.update_task_status()
     
+    def _on_proc_done(self, image_path, future):
+        """进程池任务完成回调（在执行器线程中运行）"""
+        try:
+            result = future.result()
+        except concurrent.futures.CancelledError:
+            return
+        except Exception as e:
+            print(f"压缩失败: {e}")
+            result = None
+        self.proc_compress_finished.emit(image_path, result)
+
+    def _tick_etas(self):
+        """定时刷新进行中任务的剩余时间"""
+        for widget in self.widgets:
+            if widget.status == "压缩中...":
+                widget._recompute_eta()
+
+    def _completed_results(self):
+        """按添加顺序返回已完成的压缩结果"""
+        return [result for result in self.results if result]
+
     def update_compress_progress(self, image_path, value):
         """更新压缩进度"""
-        if image_path in self.image_items:
-            _, widget = self.image_items[image_path]
-            widget.update_progress(value)
+        image_id = self.path_to_id.get(image_path)
+        if image_id is not None:
+            self.widgets[image_id].update_progress(value)
     
     def handle_compress_finished(self, image_path, result):
         """处理压缩完成"""
-        if image_path in self.image_items:
-            _, widget = self.image_items[image_path]
+        image_id = self.path_to_id.get(image_path)
+        if image_id is not None:
+            widget = self.widgets[image_id]
             
             if result:
                 widget.update_result(result)
-                self.completed_images.append(result)
+                self.results[image_id] = result
                 self.completed_count += 1
             else:
                 widget.update_status("压缩失败")
@@ -501,13 +869,9 @@ class MainWindow(QMainWindow):
     
     def download_image(self, image_path):
         """下载单个图片"""
-        # 查找对应的压缩结果
-        result = None
-        for item in self.completed_images:
-            # 根据原始路径查找
-            if item.get('original_path') == image_path:
-                result = item
-                break
+        # O(1)查找对应的压缩结果
+        image_id = self.path_to_id.get(image_path)
+        result = self.results[image_id] if image_id is not None else None
         
         if result:
             # 选择保存位置
@@ -520,8 +884,7 @@ class MainWindow(QMainWindow):
             if save_path:
                 try:
                     # 复制文件
-                    import shutil
-                    shutil.copy2(result['output_path'], save_path)
+                    _fast_copy(result['output_path'], save_path)
                     QMessageBox.information(self, "成功", f"图片已保存到: {save_path}")
                 except Exception as e:
                     QMessageBox.critical(self, "错误", f"保存图片失败: {str(e)}")
@@ -530,7 +893,7 @@ class MainWindow(QMainWindow):
     
     def batch_download(self):
         """批量下载图片"""
-        if not self.completed_images:
+        if self.completed_count == 0:
             QMessageBox.warning(self, "警告", "没有已完成的图片可以下载")
             return
         
@@ -558,16 +921,42 @@ class MainWindow(QMainWindow):
         
         # 创建压缩包
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for i, result in enumerate(self.completed_images):
-                    # 计算进度
-                    progress = (i + 1) / len(self.completed_images) * 100
-                    self.statusBar().showMessage(f"正在创建压缩包... {progress:.1f}%")
-                    QApplication.processEvents()
-                    
+            results = self._completed_results()
+            total = len(results)
+
+            def read_file(path):
+                with open(path, 'rb') as f:
+                    return f.read()
+
+            # 线程池并行预读文件内容，主线程只做归档写入；
+            # executor.map保持顺序并在写入当前文件时预读后续文件
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED,
+                                 allowZip64=True, compresslevel=1) as zipf, \
+                 concurrent.futures.ThreadPoolExecutor(
+                     max_workers=os.cpu_count() or 4) as executor:
+                data_iter = executor.map(
+                    read_file, [r['output_path'] for r in results]
+                )
+                for i, (result, data) in enumerate(zip(results, data_iter)):
                     # 添加文件到压缩包
                     arcname = os.path.basename(result['output_path'])
-                    zipf.write(result['output_path'], arcname)
+                    # JPEG/PNG/WEBP本身已是熵编码数据，再deflate只费CPU不省空间
+                    ext = os.path.splitext(arcname)[1].lower()
+                    zinfo = zipfile.ZipInfo.from_file(
+                        result['output_path'], arcname
+                    )
+                    zinfo.compress_type = (
+                        zipfile.ZIP_STORED
+                        if ext in ('.jpg', '.jpeg', '.png', '.webp')
+                        else zipfile.ZIP_DEFLATED
+                    )
+                    zipf.writestr(zinfo, data)
+
+                    # 每16个文件刷新一次界面，减少Qt事件开销
+                    if i % 16 == 0 or i + 1 == total:
+                        progress = (i + 1) / total * 100
+                        self.statusBar().showMessage(f"正在创建压缩包... {progress:.1f}%")
+                        QApplication.processEvents()
             
             self.statusBar().showMessage("就绪")
             QMessageBox.information(self, "成功", f"压缩包已创建: {zip_path}")
@@ -577,19 +966,28 @@ class MainWindow(QMainWindow):
     
     def save_images(self, save_dir):
         """保存图片到目录"""
-        import shutil
-        
         try:
-            for i, result in enumerate(self.completed_images):
-                # 计算进度
-                progress = (i + 1) / len(self.completed_images) * 100
-                self.statusBar().showMessage(f"正在保存图片... {progress:.1f}%")
-                QApplication.processEvents()
-                
-                # 复制文件
-                save_path = os.path.join(save_dir, os.path.basename(result['output_path']))
-                shutil.copy2(result['output_path'], save_path)
-            
+            completed = self._completed_results()
+            total = len(completed)
+            done = 0
+            # 4路并发复制，让多个文件的IO相互重叠
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                futures = []
+                for result in completed:
+                    save_path = os.path.join(
+                        save_dir, os.path.basename(result['output_path'])
+                    )
+                    futures.append(
+                        executor.submit(_fast_copy, result['output_path'], save_path)
+                    )
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+                    done += 1
+                    # 计算进度
+                    progress = done / total * 100
+                    self.statusBar().showMessage(f"正在保存图片... {progress:.1f}%")
+                    QApplication.processEvents()
+
             self.statusBar().showMessage("就绪")
             QMessageBox.information(self, "成功", f"图片已保存到: {save_dir}")
         except Exception as e:
@@ -598,16 +996,30 @@ class MainWindow(QMainWindow):
     
     def clear_all(self):
         """清除所有图片"""
-        # 停止所有压缩线程
-        for thread in self.compress_threads.values():
-            if thread.isRunning():
-                thread.terminate()
-        
+        # 协作式取消所有压缩任务（worker与future都提供cancel，不再terminate）
+        for task in self.tasks:
+            if task is not None:
+                task.cancel()
+
+        # 记录可能留下半成品输出的未完成任务，稍后统一清理
+        for i, result in enumerate(self.results):
+            if result is None and self.widgets[i].status == "压缩中...":
+                path = self.paths[i]
+                name, ext = os.path.splitext(os.path.basename(path))
+                self._pending_cleanup.append(os.path.join(
+                    os.path.dirname(path), f"{name}_compressed{ext}"
+                ))
+        if self._pending_cleanup:
+            # 给进行中的任务留一点退出时间，再删除半成品文件
+            QTimer.singleShot(200, self._finalize_clear)
+
         # 清空列表
         self.image_list.clear()
-        self.image_items.clear()
-        self.compress_threads.clear()
-        self.completed_images.clear()
+        self.paths.clear()
+        self.widgets.clear()
+        self.results.clear()
+        self.tasks.clear()
+        self.path_to_id.clear()
         
         # 重置计数
         self.pending_count = 0
@@ -618,6 +1030,20 @@ class MainWindow(QMainWindow):
         # 禁用批量下载按钮
         self.batch_download_button.setEnabled(False)
     
+    def _finalize_clear(self):
+        """删除被取消任务留下的半成品压缩文件"""
+        for output_path in self._pending_cleanup:
+            try:
+                os.remove(output_path)
+            except OSError:
+                pass
+        self._pending_cleanup = []
+    
+    def closeEvent(self, event):
+        """关闭窗口时回收进程池"""
+        self.proc_pool.shutdown(wait=False, cancel_futures=True)
+        super().closeEvent(event)
+
     def update_task_status(self):
         """更新任务状态"""
         self.task_status_label.setText(